@@ -8,7 +8,7 @@ with automatic chronological naming and duplicate removal.
 Features:
 - Bulk photo downloading from any website
 - Multiple URL input methods (file, clipboard, manual)
-- Smart duplicate removal (thumbnails, exact duplicates)
+- Smart duplicate removal (thumbnails, exact and near duplicates)
 - Flexible naming conventions
 - Date-based organization
 - Cross-platform compatibility
@@ -21,15 +21,102 @@ import os
 import re
 import json
 import time
+import asyncio
 import shutil
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import List, Tuple, Dict, Optional
 import sys
 import webbrowser
 import subprocess
+import functools
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlparse
+
+try:
+    import aiohttp  # Optional: enables concurrent downloads
+except ImportError:
+    aiohttp = None
+
+try:
+    from blake3 import blake3 as _hasher  # Optional: much faster file hashing
+except ImportError:
+    _hasher = hashlib.md5
+
+try:
+    import imagehash  # Optional: perceptual hashing for near duplicates
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    imagehash = None
+
+try:
+    from tqdm import tqdm  # Optional: download progress bar
+    _log = tqdm.write       # Print without breaking the bar
+except ImportError:
+    tqdm = None
+    _log = print
+
+try:
+    import orjson  # Optional: faster config file parsing
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+COPY_BUFSIZE = 256 * 1024  # Chunk size for streaming downloads and hashing
+
+# Parsed config files keyed by (absolute path, mtime_ns)
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict] = {}
+
+# Image extensions we handle, mapped to the extension we save them with
+_IMAGE_EXTENSIONS = {'.jpg': '.jpg', '.jpeg': '.jpg', '.png': '.png', '.gif': '.gif', '.webp': '.webp'}
+_CONTENT_TYPE_RE = re.compile(r'jpe?g|png|gif|webp')
+
+# Filename fragments that mark a photo as a thumbnail
+_THUMB_RE = re.compile(r'thumb(?:nail)?|_sm|_xs|-small|mini')
+
+# strftime patterns for each naming convention
+DATE_FORMATS = {
+    "YYMMDD": "%y%m%d",
+    "YYYYMMDD": "%Y%m%d",
+    "MMDDYY": "%m%d%y",
+    "DDMMYY": "%d%m%y",
+    "YYYY-MM-DD": "%Y-%m-%d",
+}
+
+@functools.lru_cache(maxsize=None)
+def _format_ordinal(ordinal: int, convention: str) -> str:
+    """Format a day (as a proleptic ordinal) once per convention"""
+    date_format = DATE_FORMATS.get(convention, "%y%m%d")  # Default: YYMMDD
+    return datetime.fromordinal(ordinal).strftime(date_format)
+
+class _PrintProgress:
+    """Fallback progress reporter when tqdm isn't installed (prints every ~5%)"""
+    
+    def __init__(self, total: int):
+        self.total = total
+        self.count = 0
+        self.step = max(10, total // 20)
+    
+    def update(self, n: int = 1):
+        self.count += n
+        if self.count % self.step == 0 or self.count == self.total:
+            print(f"  Downloaded {self.count}/{self.total}...")
+    
+    def close(self):
+        pass
 
 class PhotoOrganizer:
     """Main class for downloading and organizing photos from websites"""
@@ -38,6 +125,10 @@ class PhotoOrganizer:
         self.config_file = "config.json"
         self.config = self.load_config()
         self.setup_folders()
+        self.session = self.create_session()
+        self.download_hashes = {}  # (size, mtime_ns, digest) of downloads, by path
+        self._next_request = {}    # Earliest next request time, by host
+        self._rate_lock = threading.Lock()
     
     def load_config(self) -> Dict:
         """Load or create configuration file"""
@@ -50,17 +141,26 @@ class PhotoOrganizer:
             "date_order": "newest_first",   # newest_first or oldest_first
             "min_file_size_kb": 100,        # Minimum file size to keep
             "download_delay": 0.2,          # Delay between downloads
+            "download_workers": 10,         # Parallel downloads without aiohttp
+            "phash_threshold": 4,           # Max differing bits for near duplicates
             "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
         
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
+                # Reuse the parsed file unless it changed on disk
+                cache_key = (os.path.abspath(self.config_file),
+                             os.stat(self.config_file).st_mtime_ns)
+                if cache_key in _CONFIG_CACHE:
+                    return dict(_CONFIG_CACHE[cache_key])
+                
+                with open(self.config_file, 'rb') as f:
+                    loaded_config = _json_loads(f.read())
                 # Merge with defaults for any missing keys
                 for key, value in default_config.items():
                     if key not in loaded_config:
                         loaded_config[key] = value
+                _CONFIG_CACHE[cache_key] = dict(loaded_config)
                 return loaded_config
             except:
                 print("Error loading config, using defaults")
@@ -70,8 +170,25 @@ class PhotoOrganizer:
     
     def save_config(self):
         """Save configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        # Drop cached parses of this file; mtime may not tick on fast rewrites
+        config_path = os.path.abspath(self.config_file)
+        for cache_key in [k for k in _CONFIG_CACHE if k[0] == config_path]:
+            del _CONFIG_CACHE[cache_key]
+        
+        with open(self.config_file, 'wb') as f:
+            f.write(_json_dumps(self.config))
+    
+    def create_session(self) -> requests.Session:
+        """Create a shared HTTP session so connections are kept alive between downloads"""
+        session = requests.Session()
+        session.headers['User-Agent'] = self.config["user_agent"]
+        # Keep a pooled connection per worker so none are discarded after use
+        pool_size = max(16, self.config.get("download_workers", 10))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size,
+                              max_retries=Retry(total=3, backoff_factor=0.2))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
     
     def setup_folders(self):
         """Create necessary folders for organization"""
@@ -143,7 +260,7 @@ class PhotoOrganizer:
             print("  YYYY-MM-DD - 2025-01-28 (ISO format)")
             
             new_convention = input(f"\nEnter naming convention [current: {self.config['naming_convention']}]: ").strip().upper()
-            if new_convention in ["YYMMDD", "YYYYMMDD", "MMDDYY", "DDMMYY", "YYYY-MM-DD"]:
+            if new_convention in DATE_FORMATS:
                 self.config["naming_convention"] = new_convention
             else:
                 print("Invalid convention. Keeping current.")
@@ -275,116 +392,288 @@ class PhotoOrganizer:
                     print("Invalid date format. Proceeding without dates.")
                     assign_dates = False
         
-        downloaded_files = []
-        download_folder = self.config["download_folder"]
+        if assign_dates:
+            photo_dates = self.get_photo_dates(len(urls), start_date, end_date)
+        else:
+            photo_dates = [None] * len(urls)
         
-        for i, url in enumerate(urls):
-            try:
-                # Download image
-                headers = {'User-Agent': self.config["user_agent"]}
-                response = requests.get(url, headers=headers, timeout=30)
+        if aiohttp is not None:
+            downloaded_files = asyncio.run(self._adownload(urls, photo_dates))
+        else:
+            downloaded_files = self._download_threaded(urls, photo_dates)
+        
+        # Drop exact duplicates in URL order using digests taken while streaming
+        unique_downloads = []
+        seen_hashes = set()
+        dup_count = 0
+        for temp_path, photo_date, file_hash in downloaded_files:
+            if file_hash in seen_hashes:
+                filename = os.path.basename(temp_path)
+                dest_path = os.path.join(self.config["duplicates_folder"], filename)
+                self._cheap_move(temp_path, dest_path)
+                dup_count += 1
+                continue
+            seen_hashes.add(file_hash)
+            stat = os.stat(temp_path)
+            self.download_hashes[temp_path] = (stat.st_size, stat.st_mtime_ns, file_hash)
+            unique_downloads.append((temp_path, photo_date))
+        
+        if dup_count > 0:
+            print(f"  Skipped {dup_count} duplicate downloads")
+        
+        print(f"\n✅ Successfully downloaded {len(unique_downloads)} photos")
+        return unique_downloads
+    
+    def _download_threaded(self, urls: List[str],
+                           photo_dates: List[Optional[datetime]]) -> List[Tuple[str, datetime, str]]:
+        """Download photos with a thread pool (used when aiohttp is unavailable)"""
+        results = {}
+        progress = self.create_progress(len(urls))
+        
+        # Queue URLs per host and only hand one to a worker once its host slot
+        # is open, so workers never sit asleep on one host while others wait
+        host_queues = defaultdict(deque)
+        for i, (url, photo_date) in enumerate(zip(urls, photo_dates)):
+            host_queues[urlparse(url).netloc].append((i, url, photo_date))
+        
+        max_workers = self.config.get("download_workers", 10)
+        futures = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while host_queues or futures:
+                now = time.monotonic()
+                for host in list(host_queues):
+                    if len(futures) >= max_workers:
+                        break
+                    if self._next_request.get(host, 0.0) <= now:
+                        i, url, photo_date = host_queues[host].popleft()
+                        if not host_queues[host]:
+                            del host_queues[host]
+                        self._reserve_request_slot(url)
+                        futures[executor.submit(self._fetch, i, url, photo_date)] = i
+                
+                # Sleep until a download finishes or the next host slot opens
+                timeout = None
+                if host_queues and len(futures) < max_workers:
+                    next_slot = min(self._next_request.get(host, 0.0) for host in host_queues)
+                    timeout = max(0.0, next_slot - time.monotonic())
+                if not futures:
+                    time.sleep(timeout)
+                    continue
+                
+                done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result is not None:
+                        results[futures[future]] = result
+                    del futures[future]
+                    progress.update(1)
+        progress.close()
+        
+        # Keep files in URL order regardless of completion order
+        return [results[i] for i in sorted(results)]
+    
+    def _fetch(self, i: int, url: str,
+               photo_date: Optional[datetime]) -> Optional[Tuple[str, datetime, str]]:
+        """Download a single photo; returns (path, date, hash) or None on failure"""
+        try:
+            # Download image, streaming the body straight to disk
+            with self.session.get(url, timeout=30, stream=True) as response:
                 response.raise_for_status()
                 
                 # Check if it's an image
                 content_type = response.headers.get('content-type', '').lower()
                 if 'image' not in content_type:
-                    print(f"  Skipping non-image: {url}")
-                    continue
+                    _log(f"  Skipping non-image: {url}")
+                    return None
                 
                 # Generate filename
                 ext = self.get_file_extension(content_type, url)
                 temp_name = f"photo_{i+1:04d}{ext}"
-                temp_path = os.path.join(download_folder, temp_name)
+                temp_path = os.path.join(self.config["download_folder"], temp_name)
+                self.download_hashes.pop(temp_path, None)  # About to be overwritten
                 
-                # Save file
-                with open(temp_path, 'wb') as f:
-                    f.write(response.content)
+                # Save file, hashing it on the way so dedup needn't re-read it.
+                # Stream to a .part file so a broken download leaves nothing behind
+                file_hash = _hasher()
+                part_path = temp_path + '.part'
+                try:
+                    with open(part_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=COPY_BUFSIZE):
+                            file_hash.update(chunk)
+                            f.write(chunk)
+                    os.replace(part_path, temp_path)
+                finally:
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+            
+            return (temp_path, photo_date, file_hash.hexdigest())
+        
+        except Exception as e:
+            _log(f"  Failed to download: {str(e)[:50]}")
+            return None
+    
+    async def _adownload(self, urls: List[str],
+                         photo_dates: List[Optional[datetime]]) -> List[Tuple[str, datetime, str]]:
+        """Download photos concurrently over a single aiohttp session"""
+        semaphore = asyncio.Semaphore(16)
+        progress = self.create_progress(len(urls))
+        headers = {'User-Agent': self.config["user_agent"]}
+        connector = aiohttp.TCPConnector(limit=16)
+        
+        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+            tasks = [
+                self._download_one(session, url, i, semaphore, progress, photo_date)
+                for i, (url, photo_date) in enumerate(zip(urls, photo_dates))
+            ]
+            results = await asyncio.gather(*tasks)
+        progress.close()
+        
+        # gather() preserves input order, so files stay in URL order
+        return [result for result in results if result is not None]
+    
+    async def _download_one(self, session, url: str, i: int, semaphore: asyncio.Semaphore,
+                            progress,
+                            photo_date: Optional[datetime]) -> Optional[Tuple[str, datetime, str]]:
+        """Download a single photo; returns (path, date, hash) or None on failure"""
+        # Take a connection slot, then book this host's start time. If the host
+        # isn't ready yet, hand the slot back while waiting so other hosts proceed
+        while True:
+            await semaphore.acquire()
+            delay = self._reserve_request_slot(url)
+            if delay <= 0:
+                break
+            semaphore.release()
+            await asyncio.sleep(delay)
+        
+        try:
+            # Like requests' timeout=30: limit connect and each idle read,
+            # not the whole transfer
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+            async with session.get(url, timeout=timeout) as response:
+                response.raise_for_status()
                 
-                # Assign date if requested
-                photo_date = None
-                if assign_dates and start_date and end_date:
-                    total_days = (end_date - start_date).days
-                    progress = i / (len(urls) - 1) if len(urls) > 1 else 0
-                    if self.config["date_order"] == "newest_first":
-                        days_from_end = int(total_days * progress)
-                        photo_date = end_date - timedelta(days=days_from_end)
-                    else:
-                        days_from_start = int(total_days * progress)
-                        photo_date = start_date + timedelta(days=days_from_start)
+                # Check if it's an image
+                content_type = response.headers.get('content-type', '').lower()
+                if 'image' not in content_type:
+                    _log(f"  Skipping non-image: {url}")
+                    return None
                 
-                downloaded_files.append((temp_path, photo_date))
+                # Generate filename
+                ext = self.get_file_extension(content_type, url)
+                temp_name = f"photo_{i+1:04d}{ext}"
+                temp_path = os.path.join(self.config["download_folder"], temp_name)
+                self.download_hashes.pop(temp_path, None)  # About to be overwritten
                 
-                # Progress indicator
-                if (i + 1) % 10 == 0:
-                    print(f"  Downloaded {i+1}/{len(urls)}...")
+                # Save and hash file, keeping blocking work off the event loop.
+                # Stream to a .part file so a broken download leaves nothing behind
+                loop = asyncio.get_running_loop()
+                file_hash = _hasher()
+                part_path = temp_path + '.part'
+                f = await loop.run_in_executor(None, open, part_path, 'wb')
                 
-                # Delay to be nice to server
-                time.sleep(self.config["download_delay"])
+                def write_chunk(chunk: bytes):
+                    file_hash.update(chunk)
+                    f.write(chunk)
                 
-            except Exception as e:
-                print(f"  Failed to download: {str(e)[:50]}")
-                continue
+                try:
+                    try:
+                        async for chunk in response.content.iter_chunked(COPY_BUFSIZE):
+                            await loop.run_in_executor(None, write_chunk, chunk)
+                    finally:
+                        await loop.run_in_executor(None, f.close)
+                    await loop.run_in_executor(None, os.replace, part_path, temp_path)
+                finally:
+                    if os.path.exists(part_path):
+                        await loop.run_in_executor(None, os.remove, part_path)
+            
+            return (temp_path, photo_date, file_hash.hexdigest())
+            
+        except Exception as e:
+            _log(f"  Failed to download: {str(e)[:50]}")
+            return None
         
-        print(f"\n✅ Successfully downloaded {len(downloaded_files)} photos")
-        return downloaded_files
+        finally:
+            semaphore.release()
+            progress.update(1)
+    
+    def create_progress(self, total: int):
+        """Create a download progress reporter (tqdm bar if available)"""
+        if tqdm is not None:
+            return tqdm(total=total, unit='img')
+        return _PrintProgress(total)
+    
+    def _reserve_request_slot(self, url: str) -> float:
+        """Book a request for a URL's host if its slot is open; returns 0 when
+        booked, otherwise the seconds until the slot opens (nothing is booked)"""
+        host = urlparse(url).netloc
+        with self._rate_lock:
+            now = time.monotonic()
+            next_allowed = self._next_request.get(host, 0.0)
+            if next_allowed > now:
+                return next_allowed - now
+            self._next_request[host] = now + self.config["download_delay"]
+        return 0.0
+    
+    def get_photo_dates(self, count: int, start_date: datetime,
+                        end_date: datetime) -> List[datetime]:
+        """Spread photo dates evenly across the date range by position"""
+        total_days = (end_date - start_date).days
+        steps = max(count - 1, 1)
+        day_offsets = [int(total_days * i / steps) for i in range(count)]
+        
+        if self.config["date_order"] == "newest_first":
+            return [end_date - timedelta(days=days) for days in day_offsets]
+        else:
+            return [start_date + timedelta(days=days) for days in day_offsets]
     
     def get_file_extension(self, content_type: str, url: str) -> str:
         """Determine file extension from content type or URL"""
         # Try content type first
-        if 'jpeg' in content_type or 'jpg' in content_type:
-            return '.jpg'
-        elif 'png' in content_type:
-            return '.png'
-        elif 'gif' in content_type:
-            return '.gif'
-        elif 'webp' in content_type:
-            return '.webp'
-        
-        # Fall back to URL extension
-        url_lower = url.lower()
-        if url_lower.endswith('.jpg') or url_lower.endswith('.jpeg'):
-            return '.jpg'
-        elif url_lower.endswith('.png'):
-            return '.png'
-        elif url_lower.endswith('.gif'):
-            return '.gif'
-        elif url_lower.endswith('.webp'):
-            return '.webp'
-        
-        # Default
-        return '.jpg'
-    
-    def remove_duplicates(self, folder_path: str) -> List[str]:
-        """Remove thumbnail duplicates and return unique files"""
+        match = _CONTENT_TYPE_RE.search(content_type)
+        if match:
+            return _IMAGE_EXTENSIONS['.' + match.group()]
+        
+        # Fall back to URL extension, then default
+        url_ext = os.path.splitext(url.lower())[1]
+        return _IMAGE_EXTENSIONS.get(url_ext, '.jpg')
+    
+    def remove_duplicates(self, folder_path: str,
+                          known_hashes: Optional[Dict[str, Tuple[int, int, str]]] = None) -> List[str]:
+        """Remove thumbnail duplicates and return unique files
+        
+        known_hashes maps paths to (size, mtime_ns, digest) computed earlier
+        (e.g. while downloading); a digest is reused only if the file's size
+        and mtime still match, so unchanged files aren't read again.
+        """
         print(f"\nAnalyzing {folder_path} for duplicates...")
         
-        all_files = []
-        for filename in os.listdir(folder_path):
-            if filename.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp')):
-                filepath = os.path.join(folder_path, filename)
-                all_files.append(filepath)
+        # DirEntry carries name, path and stat, saving per-file lookups
+        with os.scandir(folder_path) as entries:
+            image_entries = [
+                entry for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS
+                and entry.is_file()
+            ]
         
-        print(f"  Found {len(all_files)} image files")
+        print(f"  Found {len(image_entries)} image files")
         
         # Remove thumbnails based on size and filename
         thumb_files = []
         candidate_files = []
+        file_sizes = {}
+        file_mtimes = {}
         min_size_kb = self.config["min_file_size_kb"]
         
-        for filepath in all_files:
-            size_kb = os.path.getsize(filepath) / 1024
-            filename = os.path.basename(filepath).lower()
+        for entry in image_entries:
+            filepath = entry.path
+            stat = entry.stat()
+            file_sizes[filepath] = stat.st_size
+            file_mtimes[filepath] = stat.st_mtime_ns
+            size_kb = file_sizes[filepath] / 1024
+            filename = entry.name.lower()
             
             # Check for thumbnail indicators
-            is_thumbnail = (
-                size_kb < min_size_kb or
-                'thumb' in filename or
-                'thumbnail' in filename or
-                '_sm' in filename or
-                '_xs' in filename or
-                '-small' in filename or
-                'mini' in filename
-            )
+            is_thumbnail = size_kb < min_size_kb or _THUMB_RE.search(filename) is not None
             
             if is_thumbnail:
                 thumb_files.append(filepath)
@@ -397,39 +686,114 @@ class PhotoOrganizer:
             for thumb_file in thumb_files:
                 filename = os.path.basename(thumb_file)
                 dest_path = os.path.join(thumb_folder, filename)
-                shutil.move(thumb_file, dest_path)
+                self._cheap_move(thumb_file, dest_path)
             print(f"  Moved {len(thumb_files)} thumbnails to backup")
         
         # Remove exact duplicates by hash
         unique_files = []
-        seen_hashes = set()
+        seen_keys = set()
         dup_count = 0
         
+        # Files with a unique size can't have a duplicate, so only hash size collisions
+        size_groups = defaultdict(list)
+        for filepath in candidate_files:
+            size_groups[file_sizes[filepath]].append(filepath)
+        known_hashes = known_hashes or {}
+        file_hashes = {}
+        to_hash = []
+        for filepath in candidate_files:
+            if len(size_groups[file_sizes[filepath]]) > 1:
+                known = known_hashes.get(filepath)
+                if known and known[:2] == (file_sizes[filepath], file_mtimes[filepath]):
+                    file_hashes[filepath] = known[2]
+                else:
+                    to_hash.append(filepath)
+        
+        # Hash in parallel (I/O-bound, hashlib releases the GIL), then dedup in order
+        max_workers = min(16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            file_hashes.update(zip(to_hash, executor.map(self.get_file_hash, to_hash)))
+        
         for filepath in candidate_files:
-            file_hash = self.get_file_hash(filepath)
-            if file_hash not in seen_hashes:
-                seen_hashes.add(file_hash)
+            dedup_key = (file_sizes[filepath], file_hashes.get(filepath))
+            if dedup_key not in seen_keys:
+                seen_keys.add(dedup_key)
                 unique_files.append(filepath)
             else:
                 dup_folder = self.config["duplicates_folder"]
                 filename = os.path.basename(filepath)
                 dest_path = os.path.join(dup_folder, filename)
-                shutil.move(filepath, dest_path)
+                self._cheap_move(filepath, dest_path)
                 dup_count += 1
         
         if dup_count > 0:
             print(f"  Removed {dup_count} exact duplicates")
         
+        unique_files = self.remove_near_duplicates(unique_files)
+        
         print(f"  Kept {len(unique_files)} unique photos")
         return unique_files
     
+    def remove_near_duplicates(self, files: List[str]) -> List[str]:
+        """Remove resized or re-encoded copies using perceptual hashes"""
+        if imagehash is None or len(files) < 2:
+            return files
+        
+        max_workers = min(16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            phashes = list(executor.map(self.get_perceptual_hash, files))
+        
+        # Files that couldn't be decoded are kept as unique. Largest first, so the
+        # original (not a resized copy) claims every match within the threshold
+        hashed = sorted(((f, h) for f, h in zip(files, phashes) if h is not None),
+                        key=lambda item: os.path.getsize(item[0]), reverse=True)
+        hashed_files = [f for f, _ in hashed]
+        fingerprints = np.array([h for _, h in hashed], dtype=np.uint64)
+        threshold = self.config.get("phash_threshold", 4)
+        
+        is_dup = np.zeros(len(fingerprints), dtype=bool)
+        for i in range(len(fingerprints)):
+            if is_dup[i]:
+                continue
+            diff_bits = (fingerprints[i + 1:] ^ fingerprints[i]).view(np.uint8).reshape(-1, 8)
+            distances = np.unpackbits(diff_bits, axis=1).sum(axis=1)
+            is_dup[i + 1:] |= distances <= threshold
+        
+        dup_files = {f for f, dup in zip(hashed_files, is_dup) if dup}
+        if dup_files:
+            dup_folder = self.config["duplicates_folder"]
+            for filepath in dup_files:
+                filename = os.path.basename(filepath)
+                dest_path = os.path.join(dup_folder, filename)
+                self._cheap_move(filepath, dest_path)
+            print(f"  Removed {len(dup_files)} near duplicates")
+        
+        return [f for f in files if f not in dup_files]
+    
+    def get_perceptual_hash(self, filepath: str) -> Optional[int]:
+        """Calculate 64-bit pHash of an image, or None if it can't be decoded"""
+        try:
+            with Image.open(filepath) as img:
+                return int(str(imagehash.phash(img)), 16)
+        except Exception:
+            return None
+    
+    def _cheap_move(self, src: str, dst: str):
+        """Move a file with a single atomic rename when on the same filesystem"""
+        try:
+            os.replace(src, dst)
+        except OSError:
+            # Cross-device: fall back to copy and delete
+            shutil.move(src, dst)
+    
     def get_file_hash(self, filepath: str) -> str:
-        """Calculate MD5 hash of a file"""
-        hash_md5 = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        """Calculate BLAKE3 hash of a file (MD5 if blake3 isn't installed)"""
+        file_hash = _hasher()
+        # Unbuffered: we already read in large chunks ourselves
+        with open(filepath, "rb", buffering=0) as f:
+            while chunk := f.read(COPY_BUFSIZE):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
     
     def organize_photos(self, files_with_dates: List[Tuple[str, Optional[datetime]]]):
         """Organize photos with user-specified naming convention"""
@@ -445,6 +809,7 @@ class PhotoOrganizer:
         
         organized_folder = self.config["organized_folder"]
         naming_convention = self.config["naming_convention"]
+        new_names = []
         
         # Process dated files
         if dated_files:
@@ -472,7 +837,8 @@ class PhotoOrganizer:
                 new_path = os.path.join(organized_folder, new_name)
                 
                 # Copy to organized folder
-                shutil.copy2(filepath, new_path)
+                self._fast_copy(filepath, new_path)
+                new_names.append(new_name)
         
         # Process undated files
         if undated_files:
@@ -482,33 +848,55 @@ class PhotoOrganizer:
                 ext = os.path.splitext(filepath)[1]
                 new_name = f"photo_{i:04d}{ext}"
                 new_path = os.path.join(organized_folder, new_name)
-                shutil.copy2(filepath, new_path)
+                self._fast_copy(filepath, new_path)
+                new_names.append(new_name)
         
-        # Show summary
-        organized_files = os.listdir(organized_folder)
-        print(f"\n✅ Organized {len(organized_files)} photos")
+        # Show summary of this run only, not files already in the folder
+        print(f"\n✅ Organized {len(new_names)} photos")
         print(f"Saved to: {organized_folder}")
         
         # Show sample
         print("\nSample files:")
-        sample_files = sorted(organized_files)[:10]
+        sample_files = heapq.nsmallest(10, new_names)
         for file in sample_files:
             print(f"  {file}")
     
+    def _fast_copy(self, src: str, dst: str):
+        """Copy a file, preferring a hardlink or in-kernel copy over read/write"""
+        # Replace rather than write through an existing file, which may be a
+        # hardlink to a different photo from an earlier run
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            return
+        if os.path.lexists(dst):
+            os.remove(dst)
+        
+        # Same filesystem: share the inode, no bytes copied
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+        
+        # Linux: copy_file_range can reflink on XFS/Btrfs and stays in the kernel
+        try:
+            with open(src, 'rb') as s, open(dst, 'wb') as d:
+                remaining = os.fstat(s.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except (AttributeError, OSError):
+            pass
+        
+        shutil.copy2(src, dst)
+    
     def format_date(self, date_obj: datetime, convention: str) -> str:
         """Format date according to naming convention"""
-        if convention == "YYMMDD":
-            return date_obj.strftime("%y%m%d")
-        elif convention == "YYYYMMDD":
-            return date_obj.strftime("%Y%m%d")
-        elif convention == "MMDDYY":
-            return date_obj.strftime("%m%d%y")
-        elif convention == "DDMMYY":
-            return date_obj.strftime("%d%m%y")
-        elif convention == "YYYY-MM-DD":
-            return date_obj.strftime("%Y-%m-%d")
-        else:
-            return date_obj.strftime("%y%m%d")  # Default
+        return _format_ordinal(date_obj.toordinal(), convention)
     
     def create_filename(self, base_name: str, counter: int, extension: str) -> str:
         """Create filename with sequential indicator"""
@@ -547,11 +935,10 @@ class PhotoOrganizer:
                     folder = self.config["download_folder"]
                 
                 if os.path.exists(folder):
-                    unique_files = self.remove_duplicates(folder)
+                    unique_files = self.remove_duplicates(folder, self.download_hashes)
                     
                     if unique_files:
                         # Ask about dates
-                        date_files = []
                         assign_dates = input("\nAssign dates to these photos? (y/n): ").strip().lower()
                         
                         if assign_dates == 'y':
@@ -562,18 +949,8 @@ class PhotoOrganizer:
                                 start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
                                 end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
                                 
-                                for i, filepath in enumerate(unique_files):
-                                    total_days = (end_date - start_date).days
-                                    progress = i / (len(unique_files) - 1) if len(unique_files) > 1 else 0
-                                    
-                                    if self.config["date_order"] == "newest_first":
-                                        days_from_end = int(total_days * progress)
-                                        photo_date = end_date - timedelta(days=days_from_end)
-                                    else:
-                                        days_from_start = int(total_days * progress)
-                                        photo_date = start_date + timedelta(days=days_from_start)
-                                    
-                                    date_files.append((filepath, photo_date))
+                                photo_dates = self.get_photo_dates(len(unique_files), start_date, end_date)
+                                date_files = list(zip(unique_files, photo_dates))
                                 
                                 self.organize_photos(date_files)
                             except: